@@ -4,14 +4,47 @@ Micro-CRM for tracking which creators to cheer on.
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+import mmap
+import os
+import pickle
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, ge
 from pathlib import Path
 from statistics import mean
-from typing import List, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - only needed with SPARK_COMPRESS=1
+    zstandard = None
 
 DATA_PATH = Path(__file__).with_name("creators.json")
+# SPARK_COMPRESS=1 keeps the snapshot as compact, zstd-compressed JSON instead.
+COMPRESSED_PATH = DATA_PATH.with_name(DATA_PATH.name + ".zst")
+COMPRESS = os.environ.get("SPARK_COMPRESS") == "1"
+SNAPSHOT_PATH = COMPRESSED_PATH if COMPRESS else DATA_PATH
+# Column-oriented copy of the snapshot, reused while the snapshot is unchanged.
+CACHE_PATH = DATA_PATH.with_suffix(".pkl")
+CACHE_VERSION = 4
+# Append-only add/boost records applied on top of the snapshot; folded back
+# into it once the log outgrows LOG_COMPACT_RATIO of the snapshot.
+LOG_PATH = DATA_PATH.with_suffix(".log.jsonl")
+LOG_COMPACT_RATIO = 0.1
+# Files above this size are parsed straight from a read-only mapping.
+MMAP_THRESHOLD = 64 * 1024
 DEFAULT_DATA = [
     {
         "handle": "@fjordsketch",
@@ -43,14 +76,15 @@ DEFAULT_DATA = [
 ]
 
 
-def format_row(columns: Sequence[str], widths: Sequence[int]) -> str:
-    padded = []
-    for value, width, align in zip(columns, widths, ("<", "<", ">", ">", "<")):
-        padded.append(f"{value:{align}{width}}")
-    return "  ".join(padded)
+# Pinned once per CLI invocation by main(); None means "ask the clock".
+_pinned_today: date | None = None
 
+# Row templates as bound str.format methods: one C-level format call per row.
+_LIST_ROW = "{:<16}  {:<10}  {:>6}  {:>18}  {:<50}".format
+_AGENDA_ROW = "{:<16}  {:<6}  {:>6}  {:>60}".format
 
-@dataclass
+
+@dataclass(slots=True)
 class Creator:
     handle: str
     platform: str
@@ -62,7 +96,7 @@ class Creator:
 
     @property
     def staleness_days(self) -> int:
-        return (date.today() - self.last_boosted).days
+        return (_today() - self.last_boosted).days
 
     def to_payload(self) -> dict:
         return {
@@ -76,46 +110,385 @@ class Creator:
         }
 
 
+@dataclass
+class Registry:
+    """Loaded creators plus a case-insensitive handle index."""
+
+    creators: List[Creator]
+    by_handle: Dict[str, Creator] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.by_handle = {c.handle.lower(): c for c in self.creators}
+
+    def add(self, creator: Creator) -> None:
+        # save_creators' stable sort places it; the list may not be sorted yet.
+        self.creators.append(creator)
+        self.by_handle[creator.handle.lower()] = creator
+
+
+@dataclass
+class CreatorTable:
+    """Column view of the registry; filters and sorts work on row indices.
+
+    Creator objects are only built (via ``row``) for the rows a command prints.
+    """
+
+    columns: Dict[str, Any]
+
+    @property
+    def heat(self) -> array:
+        return self.columns["heat"]
+
+    @property
+    def last_boosted(self) -> array:
+        return self.columns["last_boosted"]
+
+    @property
+    def by_boosted(self) -> Optional[array]:
+        # Row indices ordered by (last_boosted, -heat): the agenda order. None
+        # when missing dates were filled in at load time.
+        return self.columns["by_boosted"]
+
+    @property
+    def by_heat(self) -> Optional[Sequence[int]]:
+        # Rows are stored hottest first unless the file was hand-edited;
+        # replayed adds that land mid-order get an explicit index.
+        if not self.columns["heat_sorted"]:
+            return None
+        by_heat = self.columns.get("by_heat")
+        return range(len(self)) if by_heat is None else by_heat
+
+    @property
+    def by_staleness(self) -> Optional[array]:
+        # With rows in heat order, the agenda order is also the stable
+        # "oldest boost first" order cmd_list --sort staleness wants.
+        return self.by_boosted if self.columns["heat_sorted"] else None
+
+    @property
+    def rows(self) -> Sequence[int]:
+        # Registry order: the order ties keep here and after the next save.
+        return self.by_heat or range(len(self))
+
+    def __len__(self) -> int:
+        return len(self.columns["heat"])
+
+    def row(self, i: int) -> Creator:
+        columns = self.columns
+        return Creator(
+            handle=columns["handle"][i],
+            platform=columns["platform"][i],
+            category=columns["category"][i],
+            note=columns["note"][i],
+            heat=columns["heat"][i],
+            last_seen=date.fromordinal(columns["last_seen"][i]),
+            last_boosted=date.fromordinal(columns["last_boosted"][i]),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Data helpers
 # ---------------------------------------------------------------------------
 
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(payload: Any, indent: bool = True) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _zstandard() -> Any:
+    if zstandard is None:
+        raise SystemExit("SPARK_COMPRESS=1 needs the zstandard package (pip install zstandard).")
+    return zstandard
+
+
+def _encode_snapshot(payload: Any) -> bytes:
+    if not COMPRESS:
+        return _dumps(payload)
+    return _zstandard().ZstdCompressor(level=3).compress(_dumps(payload, indent=False))
+
+
+def _decode_snapshot(path: Path) -> Any:
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        data = _zstandard().ZstdDecompressor().decompress(data)
+    return _loads(data)
+
+
+def _read_dataset(size: int) -> Any:
+    if COMPRESS or orjson is None or size <= MMAP_THRESHOLD:
+        return _decode_snapshot(SNAPSHOT_PATH)
+    with SNAPSHOT_PATH.open("rb") as fh:
+        try:
+            mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return _loads(fh.read())
+        with mapping, memoryview(mapping) as view:
+            return orjson.loads(view)
+
+
+@lru_cache(maxsize=1)
 def _ensure_dataset() -> None:
-    if DATA_PATH.exists():
+    # Once per process: after the first call the snapshot exists, and every
+    # later write goes through save_creators.
+    if not COMPRESS and COMPRESSED_PATH.exists():
+        # The compressed snapshot is the live one; creators.json may be stale.
+        raise SystemExit(
+            f"{COMPRESSED_PATH.name} holds the current registry. Set SPARK_COMPRESS=1, "
+            f"or run `compact` without it to move the data back into {DATA_PATH.name}."
+        )
+    if SNAPSHOT_PATH.exists():
         return
-    DATA_PATH.write_text(json.dumps(DEFAULT_DATA, indent=2))
+    # The first compressed run starts from creators.json and leaves it untouched.
+    payload = _decode_snapshot(DATA_PATH) if COMPRESS and DATA_PATH.exists() else DEFAULT_DATA
+    SNAPSHOT_PATH.write_bytes(_encode_snapshot(payload))
+
+
+def _snapshot_size() -> int:
+    """Uncompressed size of the active snapshot, read from the zstd frame header."""
+    if COMPRESS:
+        with SNAPSHOT_PATH.open("rb") as fh:
+            size = _zstandard().frame_content_size(fh.read(18))  # max header size
+        if size >= 0:
+            return size
+    return SNAPSHOT_PATH.stat().st_size
+
+
+def _dataset_key() -> Tuple[int, int]:
+    stat = SNAPSHOT_PATH.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _append_entry(columns: Dict[str, Any], entry: dict) -> None:
+    # Dates are stored as ordinals; 0 marks a missing date so it still
+    # resolves to "today" on every run instead of being frozen in the cache.
+    columns["handle"].append(entry["handle"])
+    columns["platform"].append(entry["platform"])
+    columns["category"].append(entry.get("category", ""))
+    columns["note"].append(entry.get("note", ""))
+    columns["heat"].append(float(entry.get("heat", 0)))
+    columns["last_seen"].append(_date_ordinal(entry.get("last_seen")))
+    columns["last_boosted"].append(_date_ordinal(entry.get("last_boosted")))
+
+
+def _columns_from_entries(entries: Sequence[dict]) -> Dict[str, Any]:
+    columns: Dict[str, Any] = {
+        "handle": [],
+        "platform": [],
+        "category": [],
+        "note": [],
+        "heat": array("d"),
+        "last_seen": array("l"),
+        "last_boosted": array("l"),
+    }
+    for entry in entries:
+        _append_entry(columns, entry)
+    heat, boosted = columns["heat"], columns["last_boosted"]
+    columns["by_boosted"] = array(
+        "l", [i for _, _, i in sorted(_agenda_keyed(heat, boosted, range(len(heat))))]
+    )
+    columns["heat_sorted"] = all(map(ge, heat, islice(heat, 1, None)))
+    return columns
 
 
-def load_creators() -> List[Creator]:
+def _agenda_keyed(
+    heat: array, last_boosted: array, indices: Iterable[int]
+) -> List[Tuple[int, float, int]]:
+    # (last_boosted, -heat, row) tuples sort stalest-then-hottest at C level;
+    # the trailing row index keeps ties in registry order.
+    return [(last_boosted[i], -heat[i], i) for i in indices]
+
+
+def _agenda_top(heat: array, last_boosted: array, queued: List[int], k: int) -> List[int]:
+    """The first ``k`` of ``queued`` in agenda order, without decorating every row."""
+    # Find the k-th oldest boost comparing bare ints; only rows boosted on or
+    # before it can make the cut, so only those get the tuple key.
+    kth = heapq.nsmallest(k, [last_boosted[i] for i in queued])[-1]
+    candidates = [i for i in queued if last_boosted[i] <= kth]
+    return [i for _, _, i in heapq.nsmallest(k, _agenda_keyed(heat, last_boosted, candidates))]
+
+
+def _read_cache(key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    try:
+        with CACHE_PATH.open("rb") as fh:
+            version, cached_key, columns = pickle.load(fh)
+    except Exception:  # missing, truncated or stale-format sidecar
+        return None
+    if version != CACHE_VERSION or cached_key != key:
+        return None
+    return columns
+
+
+def _write_cache(key: Tuple[int, int], columns: Dict[str, Any]) -> None:
+    try:
+        with CACHE_PATH.open("wb") as fh:
+            pickle.dump((CACHE_VERSION, key, columns), fh, protocol=5)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _load_from_disk(mtime_ns: int, size: int) -> Dict[str, Any]:
+    key = (mtime_ns, size)
+    columns = _read_cache(key)
+    if columns is None:
+        columns = _columns_from_entries(_read_dataset(size))
+        _write_cache(key, columns)
+    return columns
+
+
+def _read_log() -> List[dict]:
+    try:
+        data = LOG_PATH.read_bytes()
+    except FileNotFoundError:
+        return []
+    end = data.rfind(b"\n") + 1
+    if end < len(data):
+        # An interrupted append left a partial last record. Records only count
+        # once their newline is written, so cut it off before anything appends.
+        with LOG_PATH.open("r+b") as fh:
+            fh.truncate(end)
+        data = data[:end]
+    return [_loads(line) for line in data.splitlines() if line.strip()]
+
+
+def _replay_log(columns: Dict[str, Any], records: Sequence[dict]) -> None:
+    # The cached columns are shared, so copy the ones replay writes to.
+    names = ["note", "last_boosted"]
+    if any(record["op"] == "add" for record in records):
+        names += ["handle", "platform", "category", "heat", "last_seen"]
+    for name in names:
+        columns[name] = columns[name][:]
+    heat, last_boosted = columns["heat"], columns["last_boosted"]
+    by_boosted = columns["by_boosted"]
+    if by_boosted is not None:
+        by_boosted = columns["by_boosted"] = by_boosted[:]
+    by_heat = None  # built on the first add that lands above the current tail
+
+    def agenda_key(i: int) -> Tuple[int, float, int]:
+        return last_boosted[i], -heat[i], i
+
+    rows = {handle.lower(): i for i, handle in enumerate(columns["handle"])}
+    for record in records:
+        if record["op"] == "add":
+            entry = record["creator"]
+            # Skip adds already folded into the snapshot by an interrupted compaction.
+            if entry["handle"].lower() in rows:
+                continue
+            i = rows[entry["handle"].lower()] = len(heat)
+            _append_entry(columns, entry)
+            if by_boosted is not None:
+                insort(by_boosted, i, key=agenda_key)
+            if columns["heat_sorted"]:
+                if by_heat is None and i and heat[i] > heat[i - 1]:
+                    by_heat = columns["by_heat"] = array("l", range(i))
+                if by_heat is not None:
+                    # After equal heats, where save_creators' stable sort puts it.
+                    insort(by_heat, i, key=lambda j: -heat[j])
+        elif record["op"] == "boost":
+            i = rows.get(record["handle"].lower())
+            if i is None:
+                continue
+            # Heat is unchanged, so only the agenda index needs the row moved.
+            if by_boosted is not None:
+                del by_boosted[bisect_left(by_boosted, agenda_key(i), key=agenda_key)]
+            last_boosted[i] = _date_ordinal(record["ts"])
+            if by_boosted is not None:
+                insort(by_boosted, i, key=agenda_key)
+            if record.get("note"):
+                columns["note"][i] = record["note"]
+
+
+def _log_mutation(record: dict, creators: Sequence[Creator]) -> None:
+    """Append ``record`` to the log; compact into the snapshot once it has grown."""
+    with LOG_PATH.open("ab") as fh:
+        fh.write(_dumps(record, indent=False) + b"\n")
+        log_size = fh.tell()
+    if log_size > _snapshot_size() * LOG_COMPACT_RATIO:
+        save_creators(creators)
+
+
+def _load_columns() -> Dict[str, Any]:
     _ensure_dataset()
-    raw = json.loads(DATA_PATH.read_text())
-    creators = []
-    for entry in raw:
-        creators.append(
-            Creator(
-                handle=entry["handle"],
-                platform=entry["platform"],
-                category=entry.get("category", ""),
-                note=entry.get("note", ""),
-                heat=float(entry.get("heat", 0)),
-                last_seen=_coerce_date(entry.get("last_seen")),
-                last_boosted=_coerce_date(entry.get("last_boosted")),
-            )
+    columns = dict(_load_from_disk(*_dataset_key()))
+    records = _read_log()
+    if records:
+        _replay_log(columns, records)
+    today_ord = _today().toordinal()
+    for name in ("last_seen", "last_boosted"):
+        if 0 in columns[name]:
+            columns[name] = array("l", [o or today_ord for o in columns[name]])
+            if name == "last_boosted":
+                columns["by_boosted"] = None
+    return columns
+
+
+def _creators_from_columns(columns: Dict[str, Any]) -> List[Creator]:
+    return list(
+        map(
+            Creator,
+            columns["handle"],
+            columns["platform"],
+            columns["category"],
+            columns["note"],
+            columns["heat"],
+            map(date.fromordinal, columns["last_seen"]),
+            map(date.fromordinal, columns["last_boosted"]),
         )
-    return creators
+    )
+
+
+def load_creators() -> List[Creator]:
+    return _creators_from_columns(_load_columns())
+
+
+def load_registry() -> Registry:
+    return Registry(load_creators())
+
+
+def load_table() -> CreatorTable:
+    return CreatorTable(_load_columns())
 
 
 def save_creators(creators: Sequence[Creator]) -> None:
+    # Hottest first, so `list --sort heat` can stream rows without sorting.
+    creators = sorted(creators, key=attrgetter("heat"), reverse=True)
     payload = [creator.to_payload() for creator in creators]
-    DATA_PATH.write_text(json.dumps(payload, indent=2))
+    SNAPSHOT_PATH.write_bytes(_encode_snapshot(payload))
+    LOG_PATH.unlink(missing_ok=True)
+    _load_from_disk.cache_clear()
+    # Refresh the sidecar from the rows we just wrote so the next run skips parsing.
+    _write_cache(_dataset_key(), _columns_from_entries(payload))
 
 
-def _coerce_date(value: str | None) -> date:
+def _parse_date(value: str | None) -> date | None:
     if not value:
-        return date.today()
+        return None
+    if len(value) == 10:  # plain YYYY-MM-DD, skip the datetime parser
+        return date.fromisoformat(value)
     return datetime.fromisoformat(value).date()
 
 
+def _date_ordinal(value: str | None) -> int:
+    parsed = _parse_date(value)
+    return parsed.toordinal() if parsed else 0
+
+
+def _coerce_date(value: str | None) -> date:
+    return _parse_date(value) or _today()
+
+
+def _today() -> date:
+    return _pinned_today or date.today()
+
+
 def _normalize_handle(handle: str) -> str:
     handle = handle.strip()
     if not handle.startswith("@"):
@@ -128,42 +501,66 @@ def _normalize_handle(handle: str) -> str:
 # ---------------------------------------------------------------------------
 
 def cmd_list(args: argparse.Namespace) -> None:
-    creators = load_creators()
-    filtered = [c for c in creators if c.heat >= args.min_heat]
+    table = load_table()
+    heat, min_heat = table.heat, args.min_heat
 
     if args.sort == "heat":
-        filtered.sort(key=lambda c: c.heat, reverse=True)
+        key, reverse, order = heat.__getitem__, True, table.by_heat
     else:
-        filtered.sort(key=lambda c: c.staleness_days, reverse=True)
-
-    if args.limit:
+        # Most stale first == oldest boost first.
+        key, reverse, order = table.last_boosted.__getitem__, False, table.by_staleness
+
+    # --limit 0/None means "all"; a negative limit keeps plain slice semantics.
+    top_k = args.limit if args.limit and args.limit > 0 else None
+    if order is not None:
+        # Stored order already matches: filter lazily and stop at the limit.
+        matches = (i for i in order if heat[i] >= min_heat)
+        filtered = list(islice(matches, top_k))
+    else:
+        filtered = [i for i in table.rows if heat[i] >= min_heat]
+        if top_k:
+            pick = heapq.nlargest if reverse else heapq.nsmallest
+            filtered = pick(top_k, filtered, key=key)
+        else:
+            filtered.sort(key=key, reverse=reverse)
+    if args.limit and args.limit < 0:
         filtered = filtered[: args.limit]
 
     if not filtered:
         print("No creators match the current filters.")
         return
 
-    widths = (16, 10, 6, 18, 50)
-    header = ("Handle", "Platform", "Heat", "Last boosted", "Note")
-    print(format_row(header, widths))
-    print("-" * 120)
-
-    for creator in filtered:
-        row = (
-            creator.handle,
-            creator.platform,
-            f"{creator.heat:.2f}",
-            f"{creator.last_boosted.isoformat()} ({creator.staleness_days}d)",
-            creator.note,
+    lines = [_LIST_ROW("Handle", "Platform", "Heat", "Last boosted", "Note"), "-" * 120]
+
+    today_ord = _today().toordinal()
+    for i in filtered:
+        creator = table.row(i)
+        lines.append(
+            _LIST_ROW(
+                creator.handle,
+                creator.platform,
+                f"{creator.heat:.2f}",
+                f"{creator.last_boosted.isoformat()} ({today_ord - table.last_boosted[i]}d)",
+                creator.note,
+            )
         )
-        print(format_row(row, widths))
+    # One write instead of a print (and stdout lock round-trip) per row.
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_summary(_: argparse.Namespace) -> None:
-    creators = load_creators()
-    avg_heat = mean(c.heat for c in creators)
-    hottest = max(creators, key=lambda c: c.heat)
-    stalest = max(creators, key=lambda c: c.staleness_days)
+    table = load_table()
+    heat, last_boosted = table.heat, table.last_boosted
+    avg_heat = mean(heat)
+    rows = table.rows
+    hot_i = stale_i = rows[0]
+    for i in rows:
+        if heat[i] > heat[hot_i]:
+            hot_i = i
+        if last_boosted[i] < last_boosted[stale_i]:  # oldest boost == most stale
+            stale_i = i
+    hottest, stalest = table.row(hot_i), table.row(stale_i)
+    stale_days = _today().toordinal() - last_boosted[stale_i]
 
     print("=== Creator Spark Registry ===")
     print(f"Average heat: {avg_heat:.2f}")
@@ -171,17 +568,17 @@ def cmd_summary(_: argparse.Namespace) -> None:
         f"Top lead: {hottest.handle} ({hottest.heat:.2f}) — {hottest.category} on {hottest.platform}"
     )
     print(
-        f"Needs love: {stalest.handle} (last boost {stalest.staleness_days} days ago, note: {stalest.note})"
+        f"Needs love: {stalest.handle} (last boost {stale_days} days ago, note: {stalest.note})"
     )
 
 
 def cmd_add(args: argparse.Namespace) -> None:
-    creators = load_creators()
+    registry = load_registry()
     handle = _normalize_handle(args.handle)
-    if any(c.handle.lower() == handle.lower() for c in creators):
+    if handle.lower() in registry.by_handle:
         raise SystemExit(f"Handle {handle} already exists.")
 
-    today = date.today()
+    today = _today()
     creator = Creator(
         handle=handle,
         platform=args.platform,
@@ -191,97 +588,161 @@ def cmd_add(args: argparse.Namespace) -> None:
         last_seen=_coerce_date(args.last_seen),
         last_boosted=_coerce_date(args.last_boosted) if args.last_boosted else today,
     )
-    creators.append(creator)
-    save_creators(creators)
+    registry.add(creator)
+    _log_mutation({"op": "add", "creator": creator.to_payload()}, registry.creators)
     print(f"Added {handle} with heat {creator.heat:.2f}.")
 
 
 def cmd_boost(args: argparse.Namespace) -> None:
-    creators = load_creators()
+    registry = load_registry()
     handle = _normalize_handle(args.handle)
-    try:
-        creator = next(c for c in creators if c.handle.lower() == handle.lower())
-    except StopIteration:
+    creator = registry.by_handle.get(handle.lower())
+    if creator is None:
         raise SystemExit(f"No creator named {handle} in the registry.")
 
-    creator.last_boosted = date.today()
+    creator.last_boosted = _today()
     if args.note:
         creator.note = args.note
-    save_creators(creators)
+    record = {"op": "boost", "handle": creator.handle, "ts": creator.last_boosted.isoformat()}
+    if args.note:
+        record["note"] = args.note
+    _log_mutation(record, registry.creators)
     print(f"Logged boost for {creator.handle} ({creator.category}).")
 
 
-def cmd_agenda(args: argparse.Namespace) -> None:
+def cmd_compact(_: argparse.Namespace) -> None:
+    if not COMPRESS and COMPRESSED_PATH.exists():
+        # Turning compression off: the compressed snapshot, and the log written
+        # against it, become creators.json again.
+        DATA_PATH.write_bytes(_encode_snapshot(_decode_snapshot(COMPRESSED_PATH)))
+        COMPRESSED_PATH.unlink()
     creators = load_creators()
-    cutoff = date.today() - timedelta(days=args.window)
-    queued = [c for c in creators if c.last_boosted <= cutoff]
-    queued.sort(key=lambda c: (c.staleness_days, c.heat), reverse=True)
+    save_creators(creators)
+    print(f"Compacted {len(creators)} creators into {SNAPSHOT_PATH.name}.")
+
+
+def cmd_agenda(args: argparse.Namespace) -> None:
+    table = load_table()
+    today_ord = _today().toordinal()
+    cutoff_ord = today_ord - args.window
+    heat, last_boosted, order = table.heat, table.last_boosted, table.by_boosted
+
+    if order is not None:
+        # Index scan: rows boosted on or before the cutoff are a prefix of the
+        # agenda order, so no filtering or sorting is needed.
+        queued = order[: bisect_right(order, cutoff_ord, key=last_boosted.__getitem__)]
+    else:
+        queued = [i for i in range(len(table)) if last_boosted[i] <= cutoff_ord]
 
     if not queued:
         print(f"All creators were boosted within the last {args.window} days.")
         return
 
-    widths = (16, 6, 6, 60)
-    header = ("Handle", "Heat", "Days", "Focus note")
-    print("Boost agenda (older than", args.window, "days)")
-    print(format_row(header, widths))
-    print("-" * 96)
-
-    for creator in queued[: args.limit]:
-        row = (
-            creator.handle,
-            f"{creator.heat:.2f}",
-            str(creator.staleness_days),
-            creator.note,
+    # Order by (staleness desc, heat desc).
+    if order is not None:
+        queued = queued[: args.limit]
+    elif args.limit > 0:
+        queued = _agenda_top(heat, last_boosted, queued, args.limit)
+    else:
+        queued = [i for _, _, i in sorted(_agenda_keyed(heat, last_boosted, queued))]
+        queued = queued[: args.limit]
+
+    lines = [
+        f"Boost agenda (older than {args.window} days)",
+        _AGENDA_ROW("Handle", "Heat", "Days", "Focus note"),
+        "-" * 96,
+    ]
+
+    for i in queued:
+        creator = table.row(i)
+        lines.append(
+            _AGENDA_ROW(
+                creator.handle,
+                f"{creator.heat:.2f}",
+                today_ord - table.last_boosted[i],
+                creator.note,
+            )
         )
-        print(format_row(row, widths))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Creator Spark Registry CLI")
-    sub = parser.add_subparsers(dest="command", required=True)
-
-    list_parser = sub.add_parser("list", help="List creators")
-    list_parser.add_argument("--limit", type=int, default=None)
-    list_parser.add_argument(
+def _list_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument(
         "--sort", choices=["heat", "staleness"], default="heat", help="Sort order"
     )
-    list_parser.add_argument("--min-heat", type=float, default=0.0)
-    list_parser.set_defaults(func=cmd_list)
-
-    summary_parser = sub.add_parser("summary", help="Show quick stats")
-    summary_parser.set_defaults(func=cmd_summary)
-
-    add_parser = sub.add_parser("add", help="Add a new creator")
-    add_parser.add_argument("handle")
-    add_parser.add_argument("platform")
-    add_parser.add_argument("category")
-    add_parser.add_argument("note")
-    add_parser.add_argument("heat", type=float)
-    add_parser.add_argument("--last-seen", default=date.today().isoformat())
-    add_parser.add_argument("--last-boosted", default=None)
-    add_parser.set_defaults(func=cmd_add)
-
-    boost_parser = sub.add_parser("boost", help="Log that you amplified a creator")
-    boost_parser.add_argument("handle")
-    boost_parser.add_argument("--note", default=None)
-    boost_parser.set_defaults(func=cmd_boost)
-
-    agenda_parser = sub.add_parser("agenda", help="See who needs love next")
-    agenda_parser.add_argument("--window", type=int, default=7)
-    agenda_parser.add_argument("--limit", type=int, default=5)
-    agenda_parser.set_defaults(func=cmd_agenda)
+    parser.add_argument("--min-heat", type=float, default=0.0)
+
+
+def _no_args(parser: argparse.ArgumentParser) -> None:
+    pass
 
+
+def _add_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("handle")
+    parser.add_argument("platform")
+    parser.add_argument("category")
+    parser.add_argument("note")
+    parser.add_argument("heat", type=float)
+    parser.add_argument("--last-seen", default=_today().isoformat())
+    parser.add_argument("--last-boosted", default=None)
+
+
+def _boost_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("handle")
+    parser.add_argument("--note", default=None)
+
+
+def _agenda_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--window", type=int, default=7)
+    parser.add_argument("--limit", type=int, default=5)
+
+
+# name -> (help, argument setup, handler)
+COMMANDS: Dict[
+    str,
+    Tuple[str, Callable[[argparse.ArgumentParser], None], Callable[[argparse.Namespace], None]],
+] = {
+    "list": ("List creators", _list_args, cmd_list),
+    "summary": ("Show quick stats", _no_args, cmd_summary),
+    "add": ("Add a new creator", _add_args, cmd_add),
+    "boost": ("Log that you amplified a creator", _boost_args, cmd_boost),
+    "agenda": ("See who needs love next", _agenda_args, cmd_agenda),
+    "compact": ("Fold the change log back into creators.json", _no_args, cmd_compact),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Creator Spark Registry CLI")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, (help_text, add_arguments, func) in COMMANDS.items():
+        command_parser = sub.add_parser(name, help=help_text)
+        add_arguments(command_parser)
+        command_parser.set_defaults(func=func)
     return parser
 
 
 def main(argv: Sequence[str] | None = None) -> None:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    global _pinned_today
+    _pinned_today = date.today()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = COMMANDS.get(argv[0]) if argv else None
+    if command is None:
+        # Top-level help, a missing or unknown command: the full parser reports it.
+        args = build_parser().parse_args(argv)
+    else:
+        # Only the invoked subcommand's parser gets built.
+        help_text, add_arguments, func = command
+        parser = argparse.ArgumentParser(
+            prog=f"{Path(sys.argv[0]).name} {argv[0]}", description=help_text
+        )
+        add_arguments(parser)
+        args = parser.parse_args(argv[1:])
+        args.command, args.func = argv[0], func
     args.func(args)
 
 
@@ -0,0 +1,183 @@
+import json
+
+import pytest
+
+import analyzer
+
+READ_COMMANDS = (
+    ["list"],
+    ["list", "--sort", "staleness"],
+    ["list", "--sort", "staleness", "--limit", "4", "--min-heat", "0.5"],
+    ["agenda", "--limit", "20"],
+    ["summary"],
+)
+
+
+def _rows(count):
+    # Few distinct heats and boost dates, so ordering ties are everywhere.
+    heats = (0.9, 0.5, 0.1)
+    return [
+        {
+            "handle": f"@c{i}",
+            "platform": "X",
+            "category": "test",
+            "note": f"note {i}",
+            "heat": heats[i * len(heats) // count],
+            "last_seen": "2026-01-20",
+            "last_boosted": f"2026-01-0{1 + i % 3}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    data_path = tmp_path / "creators.json"
+    monkeypatch.setattr(analyzer, "COMPRESS", False)
+    monkeypatch.setattr(analyzer, "DATA_PATH", data_path)
+    monkeypatch.setattr(analyzer, "COMPRESSED_PATH", tmp_path / "creators.json.zst")
+    monkeypatch.setattr(analyzer, "SNAPSHOT_PATH", data_path)
+    monkeypatch.setattr(analyzer, "CACHE_PATH", tmp_path / "creators.pkl")
+    monkeypatch.setattr(analyzer, "LOG_PATH", tmp_path / "creators.log.jsonl")
+    # Keep every mutation in the log until a test compacts explicitly.
+    monkeypatch.setattr(analyzer, "LOG_COMPACT_RATIO", 10.0)
+    data_path.write_text(json.dumps(_rows(30), indent=2))
+    analyzer._ensure_dataset.cache_clear()
+    analyzer._load_from_disk.cache_clear()
+    yield tmp_path
+    analyzer._ensure_dataset.cache_clear()
+    analyzer._load_from_disk.cache_clear()
+
+
+def _mutate():
+    analyzer.main(["boost", "@c3", "--note", "first"])
+    analyzer.main(["add", "@hot", "X", "test", "new", "0.95", "--last-boosted", "2026-01-02"])
+    analyzer.main(["add", "@mid", "X", "test", "new", "0.5", "--last-boosted", "2026-01-01"])
+    analyzer.main(["boost", "@c25"])
+    analyzer.main(["add", "@cold", "X", "test", "new", "0.05", "--last-boosted", "2026-01-03"])
+    analyzer.main(["boost", "@mid", "--note", "second"])
+
+
+def _outputs(capsys):
+    capsys.readouterr()
+    outputs = []
+    for argv in READ_COMMANDS:
+        analyzer.main(argv)
+        outputs.append(capsys.readouterr().out)
+    return outputs
+
+
+def test_replay_keeps_indexes_in_sync(registry):
+    _mutate()
+    assert analyzer.LOG_PATH.exists()
+    table = analyzer.load_table()
+    heat, last_boosted = table.heat, table.last_boosted
+    rows = range(len(table))
+    assert list(table.by_boosted) == sorted(rows, key=lambda i: (last_boosted[i], -heat[i], i))
+    assert list(table.by_heat) == sorted(rows, key=lambda i: (-heat[i], i))
+
+
+def test_replay_matches_compacted_output(registry, capsys):
+    _mutate()
+    pending = _outputs(capsys)
+    analyzer.main(["compact"])
+    assert not analyzer.LOG_PATH.exists()
+    assert _outputs(capsys) == pending
+
+
+def test_replayed_add_is_idempotent(registry):
+    # An add that already reached the snapshot (interrupted compaction) and
+    # a duplicated log line both replay as a single row.
+    record = {"op": "add", "creator": dict(_rows(30)[0], handle="@new", heat=0.7)}
+    lines = [{"op": "add", "creator": _rows(30)[4]}, record, record]
+    analyzer.LOG_PATH.write_text("".join(json.dumps(line) + "\n" for line in lines))
+    handles = analyzer.load_table().columns["handle"]
+    assert len(handles) == 31
+    assert handles.count("@c4") == handles.count("@new") == 1
+
+
+def test_torn_log_tail_is_dropped(registry):
+    analyzer.main(["boost", "@c7", "--note", "kept"])
+    with analyzer.LOG_PATH.open("ab") as fh:
+        fh.write(b'{"op":"boost","hand')  # interrupted append
+    analyzer.main(["summary"])
+    assert analyzer.LOG_PATH.read_bytes().endswith(b"\n")
+    analyzer.main(["boost", "@c8", "--note", "after"])
+    analyzer.main(["compact"])
+    loaded = analyzer.load_registry()
+    assert loaded.by_handle["@c7"].note == "kept"
+    assert loaded.by_handle["@c8"].note == "after"
+
+
+def test_log_compacts_past_threshold(registry, monkeypatch):
+    analyzer.main(["boost", "@c7", "--note", "kept"])
+    assert analyzer.LOG_PATH.exists()
+    monkeypatch.setattr(analyzer, "LOG_COMPACT_RATIO", 0.0)
+    analyzer.main(["boost", "@c8"])
+    assert not analyzer.LOG_PATH.exists()
+    snapshot = {row["handle"]: row for row in json.loads(analyzer.DATA_PATH.read_text())}
+    assert snapshot["@c7"]["note"] == "kept"
+    assert snapshot["@c8"]["last_boosted"] == analyzer._today().isoformat()
+
+
+def _set_compress(monkeypatch, compress):
+    monkeypatch.setattr(analyzer, "COMPRESS", compress)
+    path = analyzer.COMPRESSED_PATH if compress else analyzer.DATA_PATH
+    monkeypatch.setattr(analyzer, "SNAPSHOT_PATH", path)
+    analyzer._ensure_dataset.cache_clear()
+    analyzer._load_from_disk.cache_clear()
+
+
+def test_compress_switch_keeps_pending_and_saved_changes(registry, monkeypatch):
+    pytest.importorskip("zstandard")
+    tracked = analyzer.DATA_PATH.read_bytes()
+    _set_compress(monkeypatch, True)
+    analyzer.main(["boost", "@c3", "--note", "while compressed"])
+    assert analyzer.COMPRESSED_PATH.exists()
+    assert analyzer.DATA_PATH.read_bytes() == tracked
+
+    # Plain mode refuses to run on the stale creators.json until compact
+    # moves the compressed snapshot and its pending log back.
+    _set_compress(monkeypatch, False)
+    with pytest.raises(SystemExit):
+        analyzer.main(["add", "@plain", "X", "test", "new", "0.6"])
+    analyzer.main(["compact"])
+    assert not analyzer.COMPRESSED_PATH.exists()
+    analyzer.main(["add", "@plain", "X", "test", "new", "0.6"])
+
+    _set_compress(monkeypatch, True)
+    analyzer.main(["boost", "@plain", "--note", "back again"])
+    _set_compress(monkeypatch, False)
+    analyzer.main(["compact"])
+    loaded = analyzer.load_registry()
+    assert loaded.by_handle["@c3"].note == "while compressed"
+    assert loaded.by_handle["@plain"].note == "back again"
+    assert [path.name for path in registry.glob("creators.json*")] == ["creators.json"]
+
+
+def test_restored_plain_snapshot_does_not_replace_compressed(registry, monkeypatch):
+    pytest.importorskip("zstandard")
+    tracked = analyzer.DATA_PATH.read_bytes()
+    _set_compress(monkeypatch, True)
+    analyzer.main(["add", "@newone", "X", "test", "new", "0.6"])
+    analyzer.main(["compact"])
+    analyzer.main(["boost", "@newone", "--note", "pending"])
+    # A checkout or stash pop rewrites the tracked file with a fresh mtime.
+    analyzer.DATA_PATH.write_bytes(tracked)
+    _set_compress(monkeypatch, True)
+    assert analyzer.load_registry().by_handle["@newone"].note == "pending"
+    assert analyzer.COMPRESSED_PATH.exists()
+    assert analyzer.DATA_PATH.read_bytes() == tracked
+
+
+def test_compressed_log_compacts_on_uncompressed_size(registry, monkeypatch):
+    pytest.importorskip("zstandard")
+    _set_compress(monkeypatch, True)
+    analyzer._ensure_dataset()
+    compressed = analyzer.COMPRESSED_PATH.stat().st_size
+    assert analyzer._snapshot_size() > compressed
+    # A log bigger than the compressed file but under 10% of the JSON stays.
+    monkeypatch.setattr(analyzer, "LOG_COMPACT_RATIO", 0.1)
+    analyzer.LOG_PATH.write_bytes(b" " * int(compressed * 0.15))
+    analyzer.main(["boost", "@c1"])
+    assert analyzer.LOG_PATH.exists()